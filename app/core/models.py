@@ -64,6 +64,7 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     image = models.ImageField(null=True, upload_to=user_image_file_path)
+    updated_at = models.DateTimeField(auto_now=True)
 
     objects = UserManager()
 
@@ -108,8 +109,41 @@ class Recipe(models.Model):
     price = models.DecimalField(max_digits=5, decimal_places=2)
     link = models.CharField(max_length=255, blank=True)
     image = models.ImageField(null=True, upload_to=recipe_image_file_path)
-    ingredients = models.ManyToManyField("Ingredient")
-    tags = models.ManyToManyField("Tag")
+    updated_at = models.DateTimeField(auto_now=True)
+    ingredients = models.ManyToManyField(
+        "Ingredient",
+        through="RecipeIngredient"
+    )
+    tags = models.ManyToManyField("Tag", through="RecipeTag")
 
     def __str__(self) -> models.CharField:
         return self.title
+
+
+class RecipeTag(models.Model):
+    """Join row linking a recipe to a tag"""
+    recipe = models.ForeignKey("Recipe", on_delete=models.CASCADE)
+    tag = models.ForeignKey("Tag", on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = "core_recipe_tags"
+        unique_together = (("recipe", "tag"),)
+        indexes = [
+            models.Index(fields=["tag", "recipe"], name="core_tag_recipe_idx"),
+        ]
+
+
+class RecipeIngredient(models.Model):
+    """Join row linking a recipe to an ingredient"""
+    recipe = models.ForeignKey("Recipe", on_delete=models.CASCADE)
+    ingredient = models.ForeignKey("Ingredient", on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = "core_recipe_ingredients"
+        unique_together = (("recipe", "ingredient"),)
+        indexes = [
+            models.Index(
+                fields=["ingredient", "recipe"],
+                name="core_ingredient_recipe_idx"
+            ),
+        ]
@@ -0,0 +1,15 @@
+from functools import cached_property
+
+
+class CachedFieldsMixin:
+    """Cache the DRF fields property on the serializer instance
+
+    fields is re-evaluated several times per object rendered; caching it
+    turns the repeated property calls into a plain attribute lookup.
+    Safe for the serializers in this project because none of them change
+    their field set per request.
+    """
+
+    @cached_property
+    def fields(self):
+        return super().fields
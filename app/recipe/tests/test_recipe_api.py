@@ -1,9 +1,11 @@
-import tempfile
+import functools
+import io
 import os
 
 from PIL import Image
 
 from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 from django.urls import reverse
 
@@ -14,19 +16,44 @@ from core.models import Recipe, Tag, Ingredient
 from recipe.serializers import RecipeSerializer, RecipeDetailSerializer
 
 
+User = get_user_model()
+
 RECIPES_URL = reverse("recipe:recipe-list")
 
 
+def _encode_sample_jpeg() -> bytes:
+    """Encode the tiny JPEG shared by the image upload tests"""
+    buffer = io.BytesIO()
+    Image.new("RGB", (10, 10)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+SAMPLE_JPEG = _encode_sample_jpeg()
+
+
+@functools.lru_cache(maxsize=1024)
 def image_upload_url(recipe_id: int) -> str:
     """Return url for recipe image upload"""
     return reverse("recipe:recipe-upload-image", args=[recipe_id])
 
 
+@functools.lru_cache(maxsize=1024)
 def detail_url(recipe_id):
     """Return recipe detail url"""
     return reverse("recipe:recipe-detail", args=[recipe_id])
 
 
+def bulk_create_users(count: int) -> list:
+    """Create several users with a single INSERT for test setup"""
+    return User.objects.bulk_create([
+        User(
+            email=f"user{index}@gawlowski.com.pl",
+            password="password1234"
+        )
+        for index in range(count)
+    ])
+
+
 def sample_tag(user, name="Main course"):
     """Create and return a sample tag"""
     return Tag.objects.create(user=user, name=name)
@@ -68,20 +95,34 @@ class PublicRecipeApiTests(TestCase):
 class PrivateRecipeApiTests(TestCase):
     """Test authenticated recipe API access"""
 
-    def setUp(self) -> None:
-        self.client = APIClient()
-        self.user = get_user_model().objects.create(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create(
             email="test@gawlowski.com.pl",
             password="password1234"
         )
+
+    def setUp(self) -> None:
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_recipes(self) -> None:
         """Test retrieving a list of recipes"""
-        sample_recipe(user=self.user)
-        sample_recipe(user=self.user)
-
-        res = self.client.get(RECIPES_URL)
+        for index in range(5):
+            recipe = sample_recipe(user=self.user)
+            for suffix in range(3):
+                recipe.tags.add(
+                    sample_tag(user=self.user, name=f"Tag {index}-{suffix}")
+                )
+                recipe.ingredients.add(
+                    sample_ingredient(
+                        user=self.user,
+                        name=f"Ingredient {index}-{suffix}"
+                    )
+                )
+
+        with self.assertNumQueries(4):
+            res = self.client.get(RECIPES_URL)
 
         recipes = Recipe.objects.all().order_by("-id")
         serializer = RecipeSerializer(recipes, many=True)
@@ -89,16 +130,62 @@ class PrivateRecipeApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_200_OK)
         self.assertEqual(res.data, serializer.data)
 
+    def test_retrieve_recipes_cached(self) -> None:
+        """Test that a repeated list request is served from the cache"""
+        recipe = sample_recipe(user=self.user)
+        recipe.tags.add(sample_tag(user=self.user))
+        recipe.ingredients.add(sample_ingredient(user=self.user))
+
+        first = self.client.get(RECIPES_URL)
+
+        with self.assertNumQueries(1):
+            res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data, first.data)
+
+    def test_retrieve_recipes_cache_rotated_on_save(self) -> None:
+        """Test that saving a recipe invalidates the cached list"""
+        recipe = sample_recipe(user=self.user)
+        self.client.get(RECIPES_URL)
+
+        recipe.title = "Updated Recipe"
+        recipe.save()
+
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data[0]["title"], recipe.title)
+
+    def test_retrieve_recipes_cache_rotated_on_delete(self) -> None:
+        """Test that deleting a recipe invalidates the cached list"""
+        older = sample_recipe(user=self.user, title="Older Recipe")
+        newest = sample_recipe(user=self.user, title="Newest Recipe")
+        self.client.get(RECIPES_URL)
+
+        older.delete()
+
+        res = self.client.get(RECIPES_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 1)
+        self.assertEqual(res.data[0]["title"], newest.title)
+
     def test_recipes_limited_to_user(self) -> None:
         """Test retrieving recipes for user"""
-        user2 = get_user_model().objects.create(
-            email="test2@gawlowski.com.pl",
-            password="password1234"
-        )
+        user2 = bulk_create_users(1)[0]
         sample_recipe(user=user2)
-        sample_recipe(user=self.user)
+        recipe = sample_recipe(user=self.user)
+        for suffix in range(3):
+            recipe.tags.add(
+                sample_tag(user=self.user, name=f"Tag {suffix}")
+            )
+            recipe.ingredients.add(
+                sample_ingredient(user=self.user, name=f"Ingredient {suffix}")
+            )
 
-        res = self.client.get(RECIPES_URL)
+        with self.assertNumQueries(4):
+            res = self.client.get(RECIPES_URL)
 
         recipes = Recipe.objects.filter(user=self.user)
         serializer = RecipeSerializer(recipes, many=True)
@@ -152,9 +239,9 @@ class PrivateRecipeApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
 
         recipe = Recipe.objects.get(id=res.data["id"])
-        tags = recipe.tags.all()
+        tags = list(recipe.tags.all())
 
-        self.assertEqual(tags.count(), 2)
+        self.assertEqual(len(tags), 2)
         self.assertIn(tag1, tags)
         self.assertIn(tag2, tags)
 
@@ -174,9 +261,9 @@ class PrivateRecipeApiTests(TestCase):
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
 
         recipe = Recipe.objects.get(id=res.data["id"])
-        ingredients = recipe.ingredients.all()
+        ingredients = list(recipe.ingredients.all())
 
-        self.assertEqual(ingredients.count(), 2)
+        self.assertEqual(len(ingredients), 2)
         self.assertIn(ingredient1, ingredients)
         self.assertIn(ingredient2, ingredients)
 
@@ -198,8 +285,8 @@ class PrivateRecipeApiTests(TestCase):
         recipe.refresh_from_db()
         self.assertEqual(recipe.title, payload["title"])
 
-        tags = recipe.tags.all()
-        self.assertEqual(tags.count(), 1)
+        tags = list(recipe.tags.all())
+        self.assertEqual(len(tags), 1)
         self.assertIn(new_tag, tags)
 
     def test_full_update_recipe(self) -> None:
@@ -222,20 +309,23 @@ class PrivateRecipeApiTests(TestCase):
         self.assertEqual(recipe.time_minutes, payload["time_minutes"])
         self.assertEqual(recipe.price, payload["price"])
 
-        tags = recipe.tags.all()
+        tags = list(recipe.tags.all())
 
-        self.assertEqual(tags.count(), 0)
+        self.assertEqual(len(tags), 0)
 
 
 class RecipeImageUploadTests(TestCase):
-    def setUp(self) -> None:
-        self.client = APIClient()
-        self.user = get_user_model().objects.create(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create(
             email="test@gawlowski.com.pl",
             password="password1234"
         )
+        cls.recipe = sample_recipe(user=cls.user)
+
+    def setUp(self) -> None:
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
-        self.recipe = sample_recipe(user=self.user)
 
     def tearDown(self) -> None:
         self.recipe.image.delete()
@@ -244,20 +334,20 @@ class RecipeImageUploadTests(TestCase):
         """Test uploading an image to recipe"""
         url = image_upload_url(self.recipe.id)
 
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
-            img = Image.new("RGB", (10, 10))
-            img.save(ntf, format="JPEG")
-            ntf.seek(0)
-
-            payload = {
-                "image": ntf
-            }
-            res = self.client.post(url, payload, format="multipart")
+        payload = {
+            "image": SimpleUploadedFile(
+                "sample.jpg",
+                SAMPLE_JPEG,
+                content_type="image/jpeg"
+            )
+        }
+        res = self.client.post(url, payload, format="multipart")
 
-            self.recipe.refresh_from_db()
-            self.assertEqual(res.status_code, status.HTTP_200_OK)
-            self.assertIn("image", res.data)
-            self.assertTrue(os.path.exists(self.recipe.image.path))
+        self.recipe.refresh_from_db()
+        image_path = self.recipe.image.path
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn("image", res.data)
+        self.assertTrue(os.path.exists(image_path))
 
     def test_upload_image_bad_request(self) -> None:
         """Test uploading an invalid image"""
@@ -281,11 +371,16 @@ class RecipeImageUploadTests(TestCase):
 
         recipe1.tags.add(tag1)
         recipe2.tags.add(tag2)
+        for suffix in range(3):
+            recipe1.ingredients.add(
+                sample_ingredient(user=self.user, name=f"Ingredient {suffix}")
+            )
 
-        res = self.client.get(
-            RECIPES_URL,
-            {"tags": f"{tag1.id}, {tag2.id}"}
-        )
+        with self.assertNumQueries(4):
+            res = self.client.get(
+                RECIPES_URL,
+                {"tags": f"{tag1.id}, {tag2.id}"}
+            )
 
         serializer1 = RecipeSerializer(recipe1)
         serializer2 = RecipeSerializer(recipe2)
@@ -306,11 +401,16 @@ class RecipeImageUploadTests(TestCase):
 
         recipe1.ingredients.add(ingredient1)
         recipe2.ingredients.add(ingredient2)
-
-        res = self.client.get(
-            RECIPES_URL,
-            {"ingredients": f"{ingredient1.id}, {ingredient2.id}"}
-        )
+        for suffix in range(3):
+            recipe1.tags.add(
+                sample_tag(user=self.user, name=f"Tag {suffix}")
+            )
+
+        with self.assertNumQueries(4):
+            res = self.client.get(
+                RECIPES_URL,
+                {"ingredients": f"{ingredient1.id}, {ingredient2.id}"}
+            )
 
         serializer1 = RecipeSerializer(recipe1)
         serializer2 = RecipeSerializer(recipe2)
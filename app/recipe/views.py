@@ -1,3 +1,8 @@
+import hashlib
+
+from django.core.cache import cache
+from django.db.models import Count, Max, Prefetch
+
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import viewsets, mixins, status
@@ -8,6 +13,11 @@ from core.models import Tag, Ingredient, Recipe
 from recipe import serializers
 
 
+RECIPE_LIST_CACHE_TIMEOUT = 300
+
+_SPACE_DELETION_TABLE = str.maketrans("", "", " ")
+
+
 class BaseRecipeAttrViewSet(viewsets.GenericViewSet,
                             mixins.ListModelMixin,
                             mixins.CreateModelMixin):
@@ -56,7 +66,7 @@ class RecipeViewSet(viewsets.ModelViewSet):
     @classmethod
     def _params_to_ints(cls, qs: str) -> list:
         """Convert a list of string IDs to a list of integers"""
-        return [int(str_id) for str_id in qs.split(",")]
+        return list(map(int, qs.translate(_SPACE_DELETION_TABLE).split(",")))
 
     def get_queryset(self):
         """Retrieve the recipes for the authenticated user"""
@@ -72,7 +82,42 @@ class RecipeViewSet(viewsets.ModelViewSet):
             ingredient_ids = self._params_to_ints(ingredients)
             queryset = queryset.filter(ingredients__id__in=ingredient_ids)
 
-        return queryset.filter(user=self.request.user)
+        return queryset.filter(
+            user=self.request.user
+        ).only(
+            "id", "title", "time_minutes", "price", "link", "user"
+        ).select_related(
+            "user"
+        ).prefetch_related(
+            Prefetch("tags", queryset=Tag.objects.only("id", "name")),
+            Prefetch(
+                "ingredients",
+                queryset=Ingredient.objects.only("id", "name")
+            ),
+        ).order_by("-id")
+
+    def list(self, request, *args, **kwargs):
+        """Return the recipe list, reusing the rendered data when cached"""
+        key = self._list_cache_key(request)
+        data = cache.get(key)
+
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, timeout=RECIPE_LIST_CACHE_TIMEOUT)
+
+        return Response(data)
+
+    def _list_cache_key(self, request) -> str:
+        """Build a cache key that changes on any recipe save or delete"""
+        state = Recipe.objects.filter(user=request.user).aggregate(
+            Max("updated_at"), Count("id")
+        )
+        raw = (
+            f"{request.user.id}:{request.GET.urlencode()}:"
+            f"{state['updated_at__max']}:{state['id__count']}"
+        )
+
+        return f"recipe-list-{hashlib.blake2b(raw.encode()).hexdigest()}"
 
     def get_serializer_class(self):
         """Return appropriate serializer class"""
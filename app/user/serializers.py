@@ -3,13 +3,18 @@ from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import serializers
 
+from core.serializers import CachedFieldsMixin
 
-class UserSerializer(serializers.ModelSerializer):
+
+User = get_user_model()
+
+
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for the users object"""
-    image = serializers.CharField(required=False)
+    image = serializers.ImageField(required=False, use_url=True)
 
     class Meta:
-        model = get_user_model()
+        model = User
         fields = ("email", "password", "name", "image")
         extra_kwargs = {
             "password": {
@@ -20,21 +25,19 @@ class UserSerializer(serializers.ModelSerializer):
 
     def create(self, validated_data: dict):
         """Create a new user with encrypted password and return it"""
-        return get_user_model().objects.create_user(**validated_data)
+        return User.objects.create_user(**validated_data)
 
     def update(self, instance, validated_data):
         """Update a user, setting the password correctly and return it"""
         password = validated_data.pop("password", None)
-        user = super().update(instance, validated_data)
 
         if password:
-            user.set_password(password)
-            user.save()
+            instance.set_password(password)
 
-        return user
+        return super().update(instance, validated_data)
 
 
-class AuthTokenSerializer(serializers.Serializer):
+class AuthTokenSerializer(CachedFieldsMixin, serializers.Serializer):
     """Serializer for the API user authentication object"""
     email = serializers.CharField()
     password = serializers.CharField(
@@ -62,10 +65,11 @@ class AuthTokenSerializer(serializers.Serializer):
         return attrs
 
 
-class UserImageSerializer(serializers.ModelSerializer):
+class UserImageSerializer(CachedFieldsMixin,
+                          serializers.ModelSerializer):
     """Serializer for uploading user image"""
 
     class Meta:
-        model = get_user_model()
+        model = User
         fields = ("id", "image",)
         read_only_fields = ("id",)
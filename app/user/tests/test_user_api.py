@@ -1,25 +1,38 @@
-import tempfile
+import io
 import os
 
 from PIL import Image
 
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.urls import reverse
 
 from rest_framework.test import APIClient
 from rest_framework import status
 
 
+User = get_user_model()
+
 CREATE_USER_URL = reverse("user:create")
 TOKEN_URL = reverse("user:token")
 ME_URL = reverse("user:me")
 UPLOAD_IMAGE_URL = reverse("user:upload-image")
 
 
+def _encode_sample_jpeg() -> bytes:
+    """Encode the tiny JPEG shared by the image upload tests"""
+    buffer = io.BytesIO()
+    Image.new("RGB", (10, 10)).save(buffer, format="JPEG")
+    return buffer.getvalue()
+
+
+SAMPLE_JPEG = _encode_sample_jpeg()
+
+
 def create_user(**params):
     """Helper function to create API user for testing purpose"""
-    return get_user_model().objects.create_user(**params)
+    return User.objects.create_user(**params)
 
 
 class PublicUserApiTests(TestCase):
@@ -38,7 +51,9 @@ class PublicUserApiTests(TestCase):
         res = self.client.post(CREATE_USER_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_201_CREATED)
-        user = get_user_model().objects.get(**res.data)
+        res_data = dict(res.data)
+        self.assertIsNone(res_data.pop("image"))
+        user = User.objects.get(**res_data)
         self.assertTrue(user.check_password(payload["password"]))
         self.assertNotIn("password", res.data)
 
@@ -65,7 +80,7 @@ class PublicUserApiTests(TestCase):
         res = self.client.post(CREATE_USER_URL, payload)
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
-        user_exists = get_user_model().objects.filter(
+        user_exists = User.objects.filter(
             email=payload["email"]
         ).exists()
         self.assertFalse(user_exists)
@@ -141,13 +156,16 @@ class PublicUserApiTests(TestCase):
 class PrivateUserApiTests(TestCase):
     """Test API requests that require authentication"""
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         payload = {
             "email": "test@gawlowski.com.pl",
             "password": "password1234",
             "name": "Test API User"
         }
-        self.user = create_user(**payload)
+        cls.user = create_user(**payload)
+
+    def setUp(self) -> None:
         self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
@@ -159,10 +177,32 @@ class PrivateUserApiTests(TestCase):
         self.assertEqual(res.data, {
             "name": self.user.name,
             "email": self.user.email,
-            "image": ""
+            "image": None
         })
         self.assertNotIn("password", res.data)
 
+    def test_retrieve_profile_not_modified(self) -> None:
+        """Test that a matching ETag short-circuits with 304"""
+        res = self.client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        etag = res["ETag"]
+
+        res = self.client.get(ME_URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res["ETag"], etag)
+
+    def test_retrieve_profile_not_modified_weak_etag(self) -> None:
+        """Test that a weak If-None-Match validator also revalidates"""
+        res = self.client.get(ME_URL)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+        res = self.client.get(ME_URL, HTTP_IF_NONE_MATCH=f'W/{res["ETag"]}')
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
     def test_post_me_not_allowed(self) -> None:
         """Test that POST is not allowed on the ME url"""
         res = self.client.post(ME_URL, {})
@@ -189,12 +229,15 @@ class PrivateUserApiTests(TestCase):
 class UserImageUploadTests(TestCase):
     """Test API request for uploading user image"""
 
-    def setUp(self) -> None:
-        self.client = APIClient()
-        self.user = get_user_model().objects.create(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.user = User.objects.create(
             email="test@gawlowski.com.pl",
             password="password1234"
         )
+
+    def setUp(self) -> None:
+        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def tearDown(self) -> None:
@@ -202,22 +245,22 @@ class UserImageUploadTests(TestCase):
 
     def test_upload_user_image(self) -> None:
         """Test uploading a user image"""
-        with tempfile.NamedTemporaryFile(suffix=".jpg") as ntf:
-            img = Image.new("RGB", (10, 10))
-            img.save(ntf, format="JPEG")
-            ntf.seek(0)
-
-            payload = {
-                "image": ntf
-            }
-            res = self.client.post(UPLOAD_IMAGE_URL,
-                                   payload,
-                                   format="multipart")
-
-            self.user.refresh_from_db()
-            self.assertEqual(res.status_code, status.HTTP_200_OK)
-            self.assertIn("image", res.data)
-            self.assertTrue(os.path.exists(self.user.image.path))
+        payload = {
+            "image": SimpleUploadedFile(
+                "sample.jpg",
+                SAMPLE_JPEG,
+                content_type="image/jpeg"
+            )
+        }
+        res = self.client.post(UPLOAD_IMAGE_URL,
+                               payload,
+                               format="multipart")
+
+        self.user.refresh_from_db()
+        image_path = self.user.image.path
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn("image", res.data)
+        self.assertTrue(os.path.exists(image_path))
 
     def test_upload_user_image_bad_request(self) -> None:
         """Test uploading an invalid user image"""
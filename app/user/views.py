@@ -33,6 +33,24 @@ class ManageUserView(generics.RetrieveUpdateAPIView):
         """Retrieve and return authenticated user"""
         return self.request.user
 
+    def retrieve(self, request, *args, **kwargs):
+        """Return the profile, short-circuiting on a matching ETag"""
+        user = request.user
+        etag = f'"{user.id}-{user.updated_at.timestamp()}"'
+        client_etag = request.headers.get("If-None-Match", "")
+
+        if client_etag.startswith("W/"):
+            client_etag = client_etag[2:]
+
+        if client_etag == etag:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = super().retrieve(request, *args, **kwargs)
+
+        response["ETag"] = etag
+
+        return response
+
 
 class UserUploadImage(APIView):
     """Upload user image"""